@@ -0,0 +1,49 @@
+# coalesce.py - single-flight coalescing of identical concurrent reads
+import asyncio
+
+
+class ReadCoalescer:
+    """Share one in-flight load per request key.
+
+    Keys are tuples whose first element is the user_id, so a user's writes
+    can detach that user's in-flight loads. Nothing is cached once a load
+    finishes, so there is no cross-worker staleness to manage; each uvicorn
+    worker simply coalesces its own concurrent traffic.
+    """
+
+    def __init__(self):
+        self._inflight = {}     # key -> asyncio.Task
+
+    async def run(self, key: tuple, load):
+        """Return the result of `await load()`, shared across identical keys.
+
+        The load runs as its own task and every caller awaits it through
+        shield(), so cancelling any one request (leader included) neither
+        cancels the load nor fails the other waiters. `load` must therefore
+        not depend on request-scoped resources such as the request's session.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: tuple, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, user_id: str):
+        """Detach in-flight reads for a user after a write.
+
+        Loads already running finish for their current waiters, but new
+        requests start a fresh load that sees the write.
+        """
+        for key in [k for k in self._inflight if k[0] == user_id]:
+            del self._inflight[key]
+
+
+car_reads = ReadCoalescer()
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import car, watchlists, clerk_webhook
+from app.routers import car, watchlists, clerk_webhook, vins
 from app.auth import get_authenticated_user
 
 app = FastAPI()
@@ -26,6 +26,7 @@ app.add_middleware(
 # REMOVE dependencies from include_router - handle auth in individual endpoints instead
 app.include_router(car.router)
 app.include_router(watchlists.router)
+app.include_router(vins.router)
 app.include_router(clerk_webhook.router)  # webhook doesn't need session auth
 
 # Add a health check endpoint (important for Azure)
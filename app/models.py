@@ -1,14 +1,41 @@
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Table
+from sqlalchemy import Column, Integer, BigInteger, String, JSON, DateTime, ForeignKey, ForeignKeyConstraint, Index, Table, UniqueConstraint, func
 from app.database import Base
 from sqlalchemy.orm import relationship
 
 class Car(Base):
     __tablename__ = "cars"
+    # Hash-partitioned on user_id (see migrations/versions/0001). Always filter
+    # on Car.user_id so Postgres prunes to that user's single partition.
+    __table_args__ = (
+        UniqueConstraint("user_id", "vin", name="uq_cars_user_id_vin"),
+        {"postgresql_partition_by": "HASH (user_id)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    vin = Column(String, unique=True, index=True, nullable=False)
+    user_id = Column(String, primary_key=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    vin = Column(String, nullable=False)
     data = Column(JSON, nullable=False)
-    user_id = Column(String, index=True)
+
+class CarStatusTransition(Base):
+    __tablename__ = "car_status_transitions"
+    # Append-only; one row per status change, read by GET /cars/aging
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["user_id", "car_id"], ["cars.user_id", "cars.id"], ondelete="CASCADE"
+        ),
+        # Trailing id matches the aging report's (changed_at, id) window order
+        Index(
+            "ix_car_status_transitions_user_car_changed",
+            "user_id", "car_id", "changed_at", "id",
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    car_id = Column(Integer, nullable=False)
+    user_id = Column(String, nullable=False)
+    from_status = Column(String)
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 class Watchlist(Base):
     __tablename__ = "watchlists"
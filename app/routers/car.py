@@ -1,11 +1,15 @@
 # routers/car.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 from app.database import SessionLocal
-from app.models import Car
+from app.models import Car, CarStatusTransition
 from app.schemas import CarCreate
 from app.auth import get_authenticated_user
+from app.coalesce import car_reads
+from app.vin import normalize_vin
 
 router = APIRouter()
 
@@ -17,6 +21,27 @@ def get_db():
     finally:
         db.close()
 
+def check_status(status):
+    if not isinstance(status, str) or not status.strip():
+        raise HTTPException(status_code=400, detail="'status' must be a non-empty string")
+    return status
+
+def record_status_change(db: Session, car: Car, from_status, to_status):
+    # Added to the caller's session so it commits with the status change.
+    # Legacy rows may hold non-string statuses; those aren't stages to log.
+    if not isinstance(to_status, str) or not to_status.strip():
+        return
+    if not isinstance(from_status, str):
+        from_status = None
+    if from_status == to_status:
+        return
+    db.add(CarStatusTransition(
+        car_id=car.id,
+        user_id=car.user_id,
+        from_status=from_status,
+        to_status=to_status,
+    ))
+
 # CREATE CAR
 @router.post("/cars/")
 async def create_car(
@@ -31,10 +56,14 @@ async def create_car(
     car_data = dict(car.data)
     if "status" not in car_data:
         car_data["status"] = "Available"
+    check_status(car_data["status"])
 
     new_car = Car(vin=car.vin, data=car_data, user_id=user_id)
     db.add(new_car)
+    db.flush()  # assigns new_car.id for the transition row
+    record_status_change(db, new_car, None, car_data["status"])
     db.commit()
+    car_reads.invalidate(user_id)
     db.refresh(new_car)
 
     nested = car_data.get("Car", {})
@@ -54,12 +83,14 @@ async def create_car(
     }
 
 # GET ALL CARS
-@router.get("/cars/")
-async def get_all_cars(
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_authenticated_user)
-):
-    cars = db.query(Car).filter(Car.user_id == user_id).all()
+def load_cars(user_id: str):
+    # Opens its own session: a coalesced load can outlive the request that
+    # started it, and that request's session is closed when it finishes.
+    db = SessionLocal()
+    try:
+        cars = db.query(Car).filter(Car.user_id == user_id).all()
+    finally:
+        db.close()
     result = []
 
     for car in cars:
@@ -88,6 +119,77 @@ async def get_all_cars(
             continue
     return result
 
+@router.get("/cars/")
+async def get_all_cars(
+    request: Request,
+    user_id: str = Depends(get_authenticated_user)
+):
+    # Identical concurrent reads for the same user share one query; the load
+    # runs in the threadpool so the event loop can keep accepting followers.
+    key = (user_id, request.url.path, tuple(sorted(request.query_params.multi_items())))
+    return await car_reads.run(key, lambda: run_in_threadpool(load_cars, user_id))
+
+# AGING REPORT
+# Each transition opens a stage span that ends at the car's next transition
+# (or now). Filtering on user_id first keeps this on one index range.
+AGING_SQL = text("""
+    WITH spans AS (
+        SELECT
+            car_id,
+            to_status AS stage,
+            changed_at,
+            LEAD(changed_at) OVER w AS left_at,
+            MIN(changed_at) OVER (PARTITION BY car_id) AS entered_inventory,
+            ROW_NUMBER() OVER (PARTITION BY car_id ORDER BY changed_at DESC, id DESC) AS recency
+        FROM car_status_transitions
+        WHERE user_id = :user_id
+        WINDOW w AS (PARTITION BY car_id ORDER BY changed_at, id)
+    ),
+    per_stage AS (
+        SELECT
+            car_id,
+            stage,
+            SUM(EXTRACT(EPOCH FROM COALESCE(left_at, now()) - changed_at)) / 86400.0 AS days
+        FROM spans
+        GROUP BY car_id, stage
+    ),
+    stage_totals AS (
+        SELECT car_id, json_object_agg(stage, ROUND(days::numeric, 2)) AS stages
+        FROM per_stage
+        GROUP BY car_id
+    )
+    SELECT
+        c.id,
+        c.vin,
+        cur.stage AS status,
+        ROUND((EXTRACT(EPOCH FROM now() - cur.changed_at) / 86400.0)::numeric, 2) AS days_in_stage,
+        ROUND((EXTRACT(EPOCH FROM now() - cur.entered_inventory) / 86400.0)::numeric, 2) AS days_in_inventory,
+        st.stages
+    FROM spans cur
+    JOIN cars c ON c.user_id = :user_id AND c.id = cur.car_id
+    JOIN stage_totals st ON st.car_id = cur.car_id
+    WHERE cur.recency = 1
+    ORDER BY days_in_inventory DESC
+""")
+
+@router.get("/cars/aging")
+async def get_aging_report(
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_authenticated_user)
+):
+    rows = db.execute(AGING_SQL, {"user_id": user_id}).mappings().all()
+    return [
+        {
+            "id": row["id"],
+            "vin": row["vin"],
+            "status": row["status"],
+            "days_in_stage": float(row["days_in_stage"]),
+            "days_in_inventory": float(row["days_in_inventory"]),
+            "stages": row["stages"],
+        }
+        for row in rows
+    ]
+
 # DELETE CAR
 @router.delete("/cars/{vin}")
 async def delete_car(
@@ -95,11 +197,13 @@ async def delete_car(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_authenticated_user)
 ):
+    vin = normalize_vin(vin)  # stored VINs are normalized by CarCreate
     car = db.query(Car).filter(Car.vin == vin, Car.user_id == user_id).first()
     if not car:
         raise HTTPException(status_code=404, detail="Car not found.")
     db.delete(car)
     db.commit()
+    car_reads.invalidate(user_id)
     return {"detail": f"Car with VIN {vin} deleted."}
 
 # UPDATE CAR STATUS
@@ -110,9 +214,11 @@ async def update_car_status(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_authenticated_user)
 ):
+    vin = normalize_vin(vin)  # stored VINs are normalized by CarCreate
     new_status = payload.get("status")
     if not new_status:
         raise HTTPException(status_code=400, detail="Missing 'status' in payload")
+    check_status(new_status)
 
     car = db.query(Car).filter(Car.vin == vin, Car.user_id == user_id).first()
     if not car:
@@ -121,9 +227,11 @@ async def update_car_status(
     if car.data is None:
         car.data = {}
 
+    record_status_change(db, car, car.data.get("status"), new_status)
     car.data["status"] = new_status
     flag_modified(car, "data")
     db.commit()
+    car_reads.invalidate(user_id)
     return {"vin": vin, "status": new_status, "id": car.id}
 
 # FULL UPDATE CAR
@@ -134,6 +242,7 @@ async def update_car(
     db: Session = Depends(get_db),
     user_id: str = Depends(get_authenticated_user)
 ):
+    vin = normalize_vin(vin)  # stored VINs are normalized by CarCreate
     car = db.query(Car).filter(Car.vin == vin, Car.user_id == user_id).first()
     if not car:
         raise HTTPException(status_code=404, detail="Car not found.")
@@ -141,11 +250,17 @@ async def update_car(
     if car.data is None:
         car.data = {}
 
+    if "status" in payload:
+        check_status(payload["status"])
+
     incoming_car_data = payload.get("data", {})
     car.data["Car"] = incoming_car_data
+    old_status = car.data.get("status")
     car.data["status"] = payload.get("status", car.data.get("status", "Available"))
+    record_status_change(db, car, old_status, car.data["status"])
     flag_modified(car, "data")
     db.commit()
+    car_reads.invalidate(user_id)
     db.refresh(car)
 
     nested = car.data.get("Car", {})
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from typing import List
+
+from app import schemas
+from app.auth import get_authenticated_user
+from app.vin import decode_vins
+
+router = APIRouter(
+    prefix="/vins",
+    tags=["vins"]
+)
+
+# Validate and decode a batch of VINs locally (check digit, model year, maker)
+@router.post("/decode", response_model=List[schemas.VinDecodeResult])
+def decode(
+    request: schemas.VinDecodeRequest,
+    user_id: str = Depends(get_authenticated_user)
+):
+    return [info._asdict() for info in decode_vins(request.vins)]
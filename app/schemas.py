@@ -1,9 +1,35 @@
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field, StringConstraints, model_validator
+from typing import Annotated, Dict, Any, List, Optional
+from app.vin import decode_vin, normalize_vin
 
 class CarCreate(BaseModel):
     vin: str
     data: Dict[str, Any]  # Accepts full nested JSON
+    # Opt out of VIN validation for pre-1981 and other non-standard VINs
+    skip_vin_check: bool = False
+
+    @model_validator(mode="after")
+    def validate_vin(self):
+        if self.skip_vin_check:
+            self.vin = normalize_vin(self.vin)
+            return self
+        info = decode_vin(self.vin)
+        if not info.valid:
+            raise ValueError(info.error)
+        self.vin = info.vin
+        return self
+
+# VIN decode schemas
+class VinDecodeRequest(BaseModel):
+    vins: List[Annotated[str, StringConstraints(max_length=32)]] = Field(..., max_length=1000)
+
+class VinDecodeResult(BaseModel):
+    vin: str
+    valid: bool
+    error: Optional[str] = None
+    wmi: Optional[str] = None
+    manufacturer: Optional[str] = None
+    model_year: Optional[int] = None
 
 # WatchlistCar schemas
 class WatchlistCarBase(BaseModel):
@@ -0,0 +1,113 @@
+# vin.py - offline VIN validation and decoding (check digit, model year, WMI)
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+# ISO 3779 / 49 CFR 565 transliteration of VIN characters to numbers
+TRANSLITERATION = {
+    **{str(d): d for d in range(10)},
+    "A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6, "G": 7, "H": 8,
+    "J": 1, "K": 2, "L": 3, "M": 4, "N": 5, "P": 7, "R": 9,
+    "S": 2, "T": 3, "U": 4, "V": 5, "W": 6, "X": 7, "Y": 8, "Z": 9,
+}
+WEIGHTS = [8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2]
+
+# Position 10 codes, in order from 1980 (and again from 2010)
+YEAR_CODES = "ABCDEFGHJKLMNPRSTVWXY123456789"
+
+# World Manufacturer Identifiers. Full 3-character codes are checked first,
+# then the 2-character prefix most makers share across their plants. Codes
+# shared by several brands (e.g. the Chrysler/Dodge/Jeep/Ram family) map to
+# the manufacturer rather than guessing a brand.
+WMI_MANUFACTURERS = {
+    "1FA": "Ford", "1FT": "Ford", "1FM": "Ford", "1LN": "Lincoln",
+    "1G1": "Chevrolet", "1GC": "Chevrolet", "1GN": "Chevrolet", "1GT": "GMC",
+    "1GK": "GMC", "1G6": "Cadillac", "1GY": "Cadillac", "1G4": "Buick",
+    "1HD": "Harley-Davidson", "1HG": "Honda", "1N4": "Nissan",
+    "1N6": "Nissan", "1VW": "Volkswagen", "2HG": "Honda", "2HK": "Honda",
+    "2T1": "Toyota", "2T3": "Toyota", "3FA": "Ford", "3GN": "Chevrolet",
+    "3VW": "Volkswagen", "4S3": "Subaru", "4S4": "Subaru", "4T1": "Toyota",
+    "4T3": "Toyota", "5FN": "Honda", "5J6": "Honda", "5N1": "Nissan",
+    "5NP": "Hyundai", "5TD": "Toyota", "5TF": "Toyota", "5UX": "BMW",
+    "5YJ": "Tesla", "7SA": "Tesla", "JA3": "Mitsubishi", "JA4": "Mitsubishi",
+    "JAA": "Isuzu", "JF1": "Subaru", "JF2": "Subaru", "JHM": "Honda",
+    "JM1": "Mazda", "JN1": "Nissan", "JN8": "Nissan", "JTD": "Toyota",
+    "JTE": "Toyota", "JTH": "Lexus", "JTJ": "Lexus", "KM8": "Hyundai",
+    "KMH": "Hyundai", "KNA": "Kia", "KND": "Kia", "SAJ": "Jaguar",
+    "SAL": "Land Rover", "WA1": "Audi", "WAU": "Audi", "WBA": "BMW",
+    "WBS": "BMW", "WDD": "Mercedes-Benz", "WDC": "Mercedes-Benz",
+    "W1K": "Mercedes-Benz", "W1N": "Mercedes-Benz", "WMW": "MINI",
+    "WP0": "Porsche", "WP1": "Porsche", "WVW": "Volkswagen",
+    "WVG": "Volkswagen", "YV1": "Volvo", "YV4": "Volvo", "ZFF": "Ferrari",
+    "1C": "FCA US (Stellantis)", "2C": "FCA Canada (Stellantis)",
+    "3C": "FCA Mexico (Stellantis)", "1F": "Ford", "1G": "General Motors",
+    "1N": "Nissan", "2F": "Ford", "2G": "General Motors", "2T": "Toyota",
+    "3F": "Ford", "3G": "General Motors", "3N": "Nissan", "4T": "Toyota",
+    "5T": "Toyota", "JH": "Honda", "JM": "Mazda", "JN": "Nissan",
+    "JS": "Suzuki", "JT": "Toyota", "KL": "GM Korea", "KM": "Hyundai",
+    "KN": "Kia", "WB": "BMW", "WD": "Mercedes-Benz", "WP": "Porsche",
+    "WV": "Volkswagen", "YV": "Volvo",
+}
+
+
+class VinInfo(NamedTuple):
+    vin: str
+    valid: bool
+    error: Optional[str] = None
+    wmi: Optional[str] = None
+    manufacturer: Optional[str] = None
+    model_year: Optional[int] = None
+
+
+def normalize_vin(vin: str) -> str:
+    return vin.strip().upper()
+
+
+def check_digit(vin: str) -> str:
+    total = sum(TRANSLITERATION[ch] * weight for ch, weight in zip(vin, WEIGHTS))
+    remainder = total % 11
+    return "X" if remainder == 10 else str(remainder)
+
+
+def model_year(vin: str) -> Optional[int]:
+    # Position 10 and the position 7 cycle rule are North American only
+    if vin[0] not in "12345":
+        return None
+    index = YEAR_CODES.find(vin[9])
+    if index < 0:
+        return None
+    # Position 7 is a letter for 2010+ passenger vehicles, a digit before
+    year = 1980 + index + (30 if vin[6].isalpha() else 0)
+    # Next year's models go on sale early; anything later is a misread
+    return year if year <= date.today().year + 1 else None
+
+
+@lru_cache(maxsize=4096)
+def _decode(vin: str) -> VinInfo:
+    # Callers check the length first so the cache only ever holds 17-char keys
+    bad = sorted(set(ch for ch in vin if ch not in TRANSLITERATION))
+    if bad:
+        return VinInfo(vin, False, f"Invalid VIN characters: {''.join(bad)}")
+    # The check digit is only mandatory for North American VINs (1-5); other
+    # markets may use position 9 freely, so don't reject their VINs on it.
+    if vin[0] in "12345" and vin[8] != check_digit(vin):
+        return VinInfo(vin, False, "Invalid VIN check digit")
+
+    wmi = vin[:3]
+    manufacturer = WMI_MANUFACTURERS.get(wmi) or WMI_MANUFACTURERS.get(wmi[:2])
+    return VinInfo(vin, True, None, wmi, manufacturer, model_year(vin))
+
+
+def decode_vin(vin: str) -> VinInfo:
+    """Validate and decode one VIN. Results are cached per normalized VIN."""
+    vin = normalize_vin(vin)
+    if len(vin) != 17:
+        return VinInfo(vin, False, "VIN must be 17 characters")
+    return _decode(vin)
+
+
+def decode_vins(vins: Iterable[str]) -> List[VinInfo]:
+    """Decode a batch, in input order, doing the work once per distinct VIN."""
+    normalized = [normalize_vin(vin) for vin in vins]
+    decoded = {vin: decode_vin(vin) for vin in dict.fromkeys(normalized)}
+    return [decoded[vin] for vin in normalized]
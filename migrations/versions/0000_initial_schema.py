@@ -0,0 +1,69 @@
+"""initial schema
+
+Creates the tables as they stood before migrations were introduced. Databases
+that already have them (created outside Alembic) keep their existing tables,
+so this revision is safe to run against both fresh and existing databases.
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0000"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "cars" not in existing:
+        op.create_table(
+            "cars",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("vin", sa.String(), nullable=False),
+            sa.Column("data", sa.JSON(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=True),
+        )
+        op.create_index("ix_cars_id", "cars", ["id"])
+        op.create_index("ix_cars_vin", "cars", ["vin"], unique=True)
+        op.create_index("ix_cars_user_id", "cars", ["user_id"])
+
+    if "watchlists" not in existing:
+        op.create_table(
+            "watchlists",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=True),
+        )
+        op.create_index("ix_watchlists_id", "watchlists", ["id"])
+        op.create_index("ix_watchlists_name", "watchlists", ["name"], unique=True)
+
+    if "watchlist_cars" not in existing:
+        op.create_table(
+            "watchlist_cars",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("vin", sa.String(), nullable=True),
+            sa.Column("details", sa.JSON(), nullable=True),
+        )
+        op.create_index("ix_watchlist_cars_id", "watchlist_cars", ["id"])
+        op.create_index("ix_watchlist_cars_vin", "watchlist_cars", ["vin"])
+
+    if "watchlist_items" not in existing:
+        op.create_table(
+            "watchlist_items",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("watchlist_id", sa.Integer(), sa.ForeignKey("watchlists.id"), nullable=True),
+            sa.Column("car_id", sa.Integer(), sa.ForeignKey("watchlist_cars.id"), nullable=True),
+        )
+        op.create_index("ix_watchlist_items_id", "watchlist_items", ["id"])
+
+
+def downgrade():
+    # upgrade() may have adopted tables that predate Alembic, so dropping them
+    # here could destroy production data. Leave the schema in place.
+    pass
@@ -0,0 +1,98 @@
+"""hash-partition cars by user_id
+
+Converts the existing ``cars`` table into a table hash-partitioned on
+``user_id``. Every car query filters on ``user_id``, so each tenant's reads,
+vacuum and index maintenance touch a single small partition.
+
+Postgres requires the partition key in every unique constraint, so the
+primary key becomes ``(user_id, id)`` and VIN uniqueness becomes per user
+``(user_id, vin)``, which is what ``create_car`` already enforces. The id
+sequence is kept so existing car ids don't change.
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = "0000"
+branch_labels = None
+depends_on = None
+
+# Changing this later means re-partitioning, so leave headroom
+PARTITION_COUNT = 16
+
+
+def upgrade():
+    orphans = op.get_bind().execute(
+        sa.text("SELECT count(*) FROM cars WHERE user_id IS NULL")
+    ).scalar()
+    if orphans:
+        raise RuntimeError(
+            f"{orphans} car(s) have no user_id; assign or delete them before partitioning"
+        )
+
+    op.execute("ALTER TABLE cars RENAME TO cars_unpartitioned")
+    op.execute("ALTER TABLE cars_unpartitioned RENAME CONSTRAINT cars_pkey TO cars_unpartitioned_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_cars_id, ix_cars_vin, ix_cars_user_id")
+    op.execute("ALTER TABLE cars_unpartitioned ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE cars (
+            id integer NOT NULL DEFAULT nextval('cars_id_seq'),
+            vin varchar NOT NULL,
+            data json NOT NULL,
+            user_id varchar NOT NULL,
+            CONSTRAINT cars_pkey PRIMARY KEY (user_id, id),
+            CONSTRAINT uq_cars_user_id_vin UNIQUE (user_id, vin)
+        ) PARTITION BY HASH (user_id)
+    """)
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY cars.id")
+
+    # Constraints on the parent are created as matching indexes on each partition
+    for remainder in range(PARTITION_COUNT):
+        op.execute(
+            f"CREATE TABLE cars_p{remainder} PARTITION OF cars "
+            f"FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {remainder})"
+        )
+
+    op.execute("""
+        INSERT INTO cars (id, vin, data, user_id)
+        SELECT id, vin, data, user_id FROM cars_unpartitioned
+    """)
+    op.execute("DROP TABLE cars_unpartitioned")
+    op.execute("ANALYZE cars")
+
+
+def downgrade():
+    # Fails if two users share a VIN, since the old table made vin globally unique
+    op.execute("ALTER TABLE cars RENAME TO cars_partitioned")
+    op.execute("ALTER TABLE cars_partitioned RENAME CONSTRAINT cars_pkey TO cars_partitioned_pkey")
+    op.execute("ALTER TABLE cars_partitioned ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE cars (
+            id integer NOT NULL DEFAULT nextval('cars_id_seq'),
+            vin varchar NOT NULL,
+            data json NOT NULL,
+            user_id varchar,
+            CONSTRAINT cars_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY cars.id")
+    op.create_index("ix_cars_id", "cars", ["id"])
+    op.create_index("ix_cars_vin", "cars", ["vin"], unique=True)
+    op.create_index("ix_cars_user_id", "cars", ["user_id"])
+
+    op.execute("""
+        INSERT INTO cars (id, vin, data, user_id)
+        SELECT id, vin, data, user_id FROM cars_partitioned
+    """)
+    # Drops every cars_p* partition with it
+    op.execute("DROP TABLE cars_partitioned")
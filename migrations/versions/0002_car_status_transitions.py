@@ -0,0 +1,49 @@
+"""add car_status_transitions log
+
+Append-only log of car status changes, used by GET /cars/aging. Every
+existing car is seeded with one row for its current status. Its time in
+stage and in inventory are therefore counted from this migration.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "car_status_transitions",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("car_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id", "car_id"], ["cars.user_id", "cars.id"], ondelete="CASCADE"
+        ),
+    )
+    op.create_index(
+        "ix_car_status_transitions_user_car_changed",
+        "car_status_transitions",
+        ["user_id", "car_id", "changed_at", "id"],
+    )
+
+    op.execute("""
+        INSERT INTO car_status_transitions (car_id, user_id, from_status, to_status)
+        SELECT id, user_id, NULL, COALESCE(data->>'status', 'Available') FROM cars
+    """)
+
+
+def downgrade():
+    op.drop_index("ix_car_status_transitions_user_car_changed", table_name="car_status_transitions")
+    op.drop_table("car_status_transitions")
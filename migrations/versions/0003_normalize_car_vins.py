@@ -0,0 +1,44 @@
+"""normalize stored car VINs
+
+CarCreate and the /cars/{vin} routes trim and uppercase VINs, but cars
+created before that stored VINs exactly as sent. Normalize those so they
+stay reachable and are caught by the duplicate check on create.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Matches app.vin.normalize_vin (str.strip + str.upper) for ordinary VINs
+    collisions = op.get_bind().execute(sa.text("""
+        SELECT user_id, upper(btrim(vin)) AS normalized, string_agg(vin, ', ') AS vins
+        FROM cars
+        GROUP BY user_id, upper(btrim(vin))
+        HAVING count(*) > 1
+    """)).all()
+    if collisions:
+        details = "; ".join(
+            f"user {row.user_id}: {row.vins} -> {row.normalized}" for row in collisions
+        )
+        raise RuntimeError(
+            f"{len(collisions)} VIN(s) collide once normalized; merge or delete "
+            f"the duplicate cars before upgrading ({details})"
+        )
+
+    op.execute("UPDATE cars SET vin = upper(btrim(vin)) WHERE vin <> upper(btrim(vin))")
+
+
+def downgrade():
+    # The original spelling of each VIN isn't kept, so there is nothing to restore
+    pass